@@ -148,9 +148,44 @@ class Agent:
         
         # Store in working memory
         self.working_memory.update_git_status(git_status)
-        
+
         return self.current_context
-    
+
+    def perceive_batch(self, steps: List[str]) -> List[Dict[str, Any]]:
+        """Perceive a batch of steps against one environment snapshot.
+
+        The directory scan, git status and memory lookups dominate
+        perceive(); the steps of one multi-step task describe the same
+        moment, so take that snapshot once and derive a per-step state
+        from it instead of re-scanning for every step.
+        """
+        current_dir = os.getcwd()
+        git_status = self._get_git_status()
+        recent_interactions = self.working_memory.get_recent_interactions(3)
+        context_summary = self.working_memory.get_context_summary()
+        timestamp = time.time()
+
+        # Store in working memory once for the whole batch
+        self.working_memory.update_git_status(git_status)
+
+        states = []
+        for step in steps:
+            self.current_context.update({
+                "user_input": step,
+                "current_directory": current_dir,
+                "git_status": git_status,
+                "recent_interactions": recent_interactions,
+                "context_summary": context_summary,
+                "tool_recommendations": self.learning_system.get_tool_recommendations(
+                    self.current_context, step
+                ),
+                "timestamp": timestamp
+            })
+            # Copy so later steps don't mutate earlier states
+            states.append(dict(self.current_context))
+
+        return states
+
     def _get_git_status(self) -> Dict[str, Any]:
         """Get current git repository status"""
         try:
@@ -193,6 +193,12 @@ class WorkingMemory:
         if not self.current_session_id:
             self.start_session()
         self.sessions[self.current_session_id]["user_preferences"][key] = value
+
+    def snapshot_preferences(self) -> Dict[str, Any]:
+        """Return a copy of all user preferences in one lookup"""
+        if not self.current_session_id:
+            return {}
+        return dict(self.sessions[self.current_session_id]["user_preferences"])
     
     def _extract_pattern(self, text: str) -> str:
         """Extract simple pattern from user input for learning"""
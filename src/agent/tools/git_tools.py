@@ -15,12 +15,16 @@ class GitStatusTool(BaseTool):
     def execute(self) -> Dict[str, Any]:
         try:
             repo = git.Repo(os.getcwd())
+            # Plain name-only diffs: index.diff() builds a full Diff object
+            # (blobs, rename detection) per entry when only paths are needed
+            modified = repo.git.diff("--name-only", "--no-renames", "-z").split("\x00")
+            staged = repo.git.diff("--cached", "--name-only", "--no-renames", "-z", "HEAD").split("\x00")
             return {
                 "success": True,
                 "is_dirty": repo.is_dirty(),
                 "untracked_files": repo.untracked_files,
-                "modified_files": [item.a_path for item in repo.index.diff(None)],
-                "staged_files": [item.a_path for item in repo.index.diff("HEAD")],
+                "modified_files": [path for path in modified if path],
+                "staged_files": [path for path in staged if path],
                 "active_branch": repo.active_branch.name,
                 "message": "Successfully retrieved git status"
             }
@@ -45,21 +49,29 @@ class GitDiffTool(BaseTool):
         return {
             "required": [],
             "optional": {
-                "file_path": ""
+                "file_path": "",
+                "encoding": "utf-8",
+                "raw_bytes": False
             }
         }
 
-    def execute(self, file_path: str = "") -> Dict[str, Any]:
+    def execute(self, file_path: str = "", encoding: str = "utf-8",
+                raw_bytes: bool = False) -> Dict[str, Any]:
         try:
             repo = git.Repo(os.getcwd())
-            
+
+            # Take the diff as bytes so large output is not UTF-8-validated
+            # unless the caller actually needs text
             if file_path:
                 # Diff for a specific file
-                diff_text = repo.git.diff([file_path]) if os.path.exists(file_path) else ""
+                diff_data = repo.git.diff([file_path], stdout_as_string=False) if os.path.exists(file_path) else b""
             else:
                 # Diff for all changes
-                diff_text = repo.git.diff()
-            
+                diff_data = repo.git.diff(stdout_as_string=False)
+
+            # 'latin-1' is a cheap 1:1 byte map when exact text isn't needed
+            diff_text = diff_data if raw_bytes else diff_data.decode(encoding, errors="replace")
+
             return {
                 "success": True,
                 "diff": diff_text,
@@ -124,8 +136,8 @@ class GitBranchTool(BaseTool):
     
     @property
     def description(self) -> str:
-        return "Manage git branches (list, create, delete, switch)"
-    
+        return "Manage git branches (list, create, delete, switch, worktree)"
+
     @property
     def parameters(self) -> Dict[str, Any]:
         return {
@@ -134,13 +146,18 @@ class GitBranchTool(BaseTool):
                 "action": {
                     "type": "string",
                     "default": "list",
-                    "description": "Action to perform (list, create, delete, switch)"
+                    "description": "Action to perform (list, create, delete, switch, worktree)"
                 },
                 "branch_name": {
                     "type": "string",
                     "default": "",
                     "description": "Name of the branch"
                 },
+                "worktree_path": {
+                    "type": "string",
+                    "default": "",
+                    "description": "Directory for the new worktree (worktree action only)"
+                },
                 "force": {
                     "type": "boolean",
                     "default": False,
@@ -148,8 +165,9 @@ class GitBranchTool(BaseTool):
                 }
             }
         }
-    
-    def execute(self, action: str = "list", branch_name: str = "", force: bool = False) -> Dict[str, Any]:
+
+    def execute(self, action: str = "list", branch_name: str = "", worktree_path: str = "",
+                force: bool = False) -> Dict[str, Any]:
         try:
             repo = git.Repo(os.getcwd())
             
@@ -221,11 +239,29 @@ class GitBranchTool(BaseTool):
                     "message": f"Switched to branch '{branch_name}'"
                 }
             
+            elif action == "worktree":
+                if not branch_name or not worktree_path:
+                    return {
+                        "success": False,
+                        "error": "Branch name and worktree path are required for worktree action",
+                        "message": "Please provide both a branch name and a worktree path"
+                    }
+
+                # A worktree gets its own checkout and index, so several branches
+                # can be explored in parallel without fighting over the index lock
+                repo.git.worktree("add", worktree_path, "-b", branch_name)
+                return {
+                    "success": True,
+                    "branch_name": branch_name,
+                    "worktree_path": worktree_path,
+                    "message": f"Created worktree at '{worktree_path}' on new branch '{branch_name}'"
+                }
+
             else:
                 return {
                     "success": False,
                     "error": f"Unknown action: {action}",
-                    "message": f"Action '{action}' is not supported. Use list, create, delete, or switch."
+                    "message": f"Action '{action}' is not supported. Use list, create, delete, switch, or worktree."
                 }
         
         except Exception as e:
@@ -1,6 +1,51 @@
+import atexit
+import threading
 from ..tools.base import BaseTool
 from typing import Dict, Any, Optional
 
+# Write-behind queue for persistent preference storage: rapid updates are
+# coalesced into one flush per interval instead of one disk write each
+_FLUSH_INTERVAL = 0.2
+
+_pending = {}
+_pending_lock = threading.Lock()
+_flush_timer = None
+_persistent_memory = None
+
+def _flush_pending():
+    """Write all staged preferences to persistent memory in one batch."""
+    global _flush_timer
+    with _pending_lock:
+        dirty = dict(_pending)
+        _pending.clear()
+        _flush_timer = None
+        memory = _persistent_memory
+
+    if memory:
+        for key, (value, confidence) in dirty.items():
+            memory.store_preference(key, value, confidence)
+
+def _stage_preference(persistent_memory, key: str, value: Any, confidence: float):
+    """Stage a preference for the next coalesced flush."""
+    global _flush_timer, _persistent_memory
+    with _pending_lock:
+        _persistent_memory = persistent_memory
+        _pending[key] = (value, confidence)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(_FLUSH_INTERVAL, _flush_pending)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+atexit.register(_flush_pending)
+
+# Preferences surfaced by ShowPreferencesTool and their defaults
+_DEFAULTS = {
+    "verbosity": "normal",
+    "auto_approve": False,
+    "show_diffs": True,
+    "communication_style": "balanced"
+}
+
 class SetPreferenceTool(BaseTool):
     @property
     def name(self) -> str:
@@ -22,8 +67,9 @@ class SetPreferenceTool(BaseTool):
         try:
             # Use the agent reference passed during registration
             if hasattr(self, 'agent') and self.agent:
+                # In-RAM update is immediate; the disk write is coalesced
                 self.agent.working_memory.set_user_preference(key, value)
-                self.agent.persistent_memory.store_preference(key, value, 0.8)
+                _stage_preference(self.agent.persistent_memory, key, value, 0.8)
             
             return {
                 "success": True,
@@ -55,20 +101,13 @@ class ShowPreferencesTool(BaseTool):
         try:
             # Use the agent reference passed during registration
             if hasattr(self, 'agent') and self.agent:
-                preferences = {
-                    "verbosity": self.agent.working_memory.get_user_preference("verbosity", "normal"),
-                    "auto_approve": self.agent.working_memory.get_user_preference("auto_approve", False),
-                    "show_diffs": self.agent.working_memory.get_user_preference("show_diffs", True),
-                    "communication_style": self.agent.working_memory.get_user_preference("communication_style", "balanced")
-                }
+                # One snapshot instead of a lookup per preference
+                snapshot = self.agent.working_memory.snapshot_preferences()
+                preferences = {key: snapshot.get(key, default)
+                               for key, default in _DEFAULTS.items()}
             else:
                 # Fallback preferences if agent not available
-                preferences = {
-                    "verbosity": "normal",
-                    "auto_approve": False,
-                    "show_diffs": True,
-                    "communication_style": "balanced"
-                }
+                preferences = dict(_DEFAULTS)
             
             return {
                 "success": True,
@@ -1,11 +1,221 @@
 import os
+import re
 import shutil
+import time
 import git
 import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from ..tools.base import BaseTool
 
+try:
+    import blake3
+    _new_hasher = blake3.blake3
+except ImportError:
+    import hashlib
+    _new_hasher = hashlib.blake2b
+
+# Characters in a relative path that must not appear in a backup filename
+_SAFE = re.compile(r'[./\\:]')
+
+def _store_object(file_path: str, backup_dir: str) -> tuple:
+    """Store file content under objects/<hash>, deduplicating identical content.
+
+    Returns (hash, object_path). The content is hashed in a read-only
+    pass first; the object is only written when that hash is new, so
+    repeated backups of unchanged content never pay a write.
+    """
+    objects_dir = os.path.join(backup_dir, 'objects')
+    os.makedirs(objects_dir, exist_ok=True)
+
+    hasher = _new_hasher()
+    with open(file_path, 'rb') as src:
+        for chunk in iter(lambda: src.read(1 << 20), b''):
+            hasher.update(chunk)
+
+    file_hash = hasher.hexdigest()
+    object_path = os.path.join(objects_dir, file_hash)
+    if not os.path.exists(object_path):
+        temp_path = os.path.join(objects_dir, f'.tmp_{time.time_ns():d}')
+        with open(file_path, 'rb') as src, open(temp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        os.replace(temp_path, object_path)
+
+    return file_hash, object_path
+
+def _manifest_connect(backup_dir: str) -> sqlite3.Connection:
+    """Open (and if needed create) the backup manifest database."""
+    manifest_path = os.path.join(backup_dir, 'index.db')
+    fresh = not os.path.exists(manifest_path)
+
+    conn = sqlite3.connect(manifest_path)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS backups (
+            filename TEXT PRIMARY KEY,
+            backup_path TEXT,
+            original_path TEXT,
+            size INTEGER,
+            created TEXT,
+            hash TEXT
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_backups_created ON backups(created DESC)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_backups_original ON backups(original_path)')
+
+    # A new manifest must absorb backups that predate it, or listings
+    # would stop at the manifest's own creation
+    if fresh:
+        _backfill_manifest(conn, backup_dir)
+
+    return conn
+
+def _backfill_manifest(conn: sqlite3.Connection, backup_dir: str):
+    """Index backups already on disk into a freshly created manifest."""
+    try:
+        filenames = os.listdir(backup_dir)
+    except OSError:
+        return
+
+    rows = []
+    for filename in filenames:
+        if filename.endswith('.meta') or filename in ('objects', 'index.db'):
+            continue
+
+        backup_path = os.path.join(backup_dir, filename)
+        if not os.path.isfile(backup_path):
+            continue
+
+        metadata = {}
+        try:
+            with open(f'{backup_path}.meta', 'r') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        try:
+            stat = os.stat(backup_path)
+        except OSError:
+            continue
+
+        rows.append((
+            filename, backup_path, metadata.get("original_path", ""),
+            stat.st_size, datetime.fromtimestamp(stat.st_ctime).isoformat(),
+            metadata.get("hash", "")
+        ))
+
+    if rows:
+        with conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO backups'
+                '(filename, backup_path, original_path, size, created, hash)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            )
+
+def _create_backup(file_path: str, backup_dir: str = '') -> Dict[str, Any]:
+    """Back up a file and write its metadata; shared by backup and restore."""
+    try:
+        if not os.path.exists(file_path):
+            return {
+                "success": False,
+                "error": f"File {file_path} does not exist",
+                "message": f"Cannot backup non-existent file: {file_path}"
+            }
+
+        # Use same drive as source file to avoid cross-drive issues
+        if not backup_dir:
+            # Create backup directory on the same drive as the source file
+            drive_letter = os.path.splitdrive(file_path)[0]  # Get 'C:' from 'C:\path\file'
+            if drive_letter:
+                backup_dir = os.path.join(drive_letter, "\\.agent_backups")
+            else:
+                backup_dir = os.path.join(os.getcwd(), '.agent_backups')
+
+        os.makedirs(backup_dir, exist_ok=True)
+
+        # Nanosecond suffix is monotonically unique; the 1-second strftime
+        # resolution could collide when the same file is backed up rapidly
+        suffix = f'{time.time_ns():d}'
+        relative_path = os.path.relpath(file_path, os.getcwd())
+        safe_filename = _SAFE.sub('_', relative_path)
+        backup_filename = f'{safe_filename}_{suffix}'
+        backup_path = os.path.join(backup_dir, backup_filename)
+
+        # Content-addressed storage: one copy per unique content, with
+        # backup entries hard-linked to it
+        file_hash, object_path = _store_object(file_path, backup_dir)
+        try:
+            os.link(object_path, backup_path)
+        except OSError:
+            # Hard links unavailable (e.g. FAT or network shares)
+            shutil.copy2(object_path, backup_path)
+
+        metadata = {
+            "original_path": file_path,
+            "backup_path": backup_path,
+            "timestamp": datetime.now().strftime('%Y%m%d_%H%M%S'),
+            "size": os.path.getsize(file_path),
+            "hash": file_hash
+        }
+
+        metadata_path = f'{backup_path}.meta'
+        with open(metadata_path, 'w') as f:
+            json.dump(metadata, f)
+
+        # Record the backup in the manifest so listing is a single indexed
+        # query; the .meta file stays the source of truth
+        try:
+            conn = _manifest_connect(backup_dir)
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO backups'
+                    '(filename, backup_path, original_path, size, created, hash)'
+                    ' VALUES (?, ?, ?, ?, ?, ?)',
+                    (backup_filename, backup_path, file_path,
+                     metadata["size"], datetime.now().isoformat(), file_hash)
+                )
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+        return {
+            "success": True,
+            "backup_path": backup_path,
+            "metadata": metadata,
+            "message": f"Successfully created backup of {file_path} at {backup_path}"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"Failed to backup file {file_path}: {str(e)}"
+        }
+
+def _load_backup_entry(entry: tuple) -> Dict[str, Any]:
+    """Read one backup's stat and metadata (run from a thread pool)."""
+    filename, backup_path, metadata_path = entry
+
+    metadata = {}
+    if os.path.exists(metadata_path):
+        try:
+            with open(metadata_path, 'r') as f:
+                metadata = json.load(f)
+        except:
+            pass
+
+    stat = os.stat(backup_path)
+
+    return {
+        "filename": filename,
+        "backup_path": backup_path,
+        "original_path": metadata.get("original_path", ""),
+        "size": stat.st_size,
+        "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+        "metadata": metadata
+    }
+
 class BackupFileTool(BaseTool):
     @property
     def name(self) -> str:
@@ -29,57 +239,7 @@ class BackupFileTool(BaseTool):
         }
     
     def execute(self, file_path: str, backup_dir: str = '') -> Dict[str, Any]:
-        try:
-            if not os.path.exists(file_path):
-                return {
-                    "success": False,
-                    "error": f"File {file_path} does not exist",
-                    "message": f"Cannot backup non-existent file: {file_path}"
-                }
-            
-            # Use same drive as source file to avoid cross-drive issues
-            if not backup_dir:
-                # Create backup directory on the same drive as the source file
-                drive_letter = os.path.splitdrive(file_path)[0]  # Get 'C:' from 'C:\path\file'
-                if drive_letter:
-                    backup_dir = os.path.join(drive_letter, "\\.agent_backups")
-                else:
-                    backup_dir = os.path.join(os.getcwd(), '.agent_backups')
-            
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            relative_path = os.path.relpath(file_path, os.getcwd())
-            safe_filename = relative_path.replace(os.sep, '_').replace('.', '_')
-            backup_filename = f'{safe_filename}_{timestamp}'
-            backup_path = os.path.join(backup_dir, backup_filename)
-            
-            # Use shutil.copy2 which preserves metadata and handles cross-drive copies
-            shutil.copy2(file_path, backup_path)
-            
-            metadata = {
-                "original_path": file_path,
-                "backup_path": backup_path,
-                "timestamp": timestamp,
-                "size": os.path.getsize(file_path)
-            }
-            
-            metadata_path = f'{backup_path}.meta'
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f)
-            
-            return {
-                "success": True,
-                "backup_path": backup_path,
-                "metadata": metadata,
-                "message": f"Successfully created backup of {file_path} at {backup_path}"
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "message": f"Failed to backup file {file_path}: {str(e)}"
-            }
+        return _create_backup(file_path, backup_dir)
 
 class RestoreFileTool(BaseTool):
     @property
@@ -128,11 +288,9 @@ class RestoreFileTool(BaseTool):
                 target_path = metadata.get("original_path", backup_path)
             
             if os.path.exists(target_path) and create_backup and target_path != backup_path:
-                backup_tool = BackupFileTool()
-                backup_result = backup_tool.execute(
-                    file_path=target_path,
-                    backup_dir=os.path.dirname(backup_path)
-                )
+                # Call the helper directly rather than dispatching through a
+                # fresh BackupFileTool instance
+                backup_result = _create_backup(target_path, os.path.dirname(backup_path))
                 if not backup_result["success"]:
                     return {
                         "success": False,
@@ -196,37 +354,68 @@ class ListBackupsTool(BaseTool):
                     "message": f"No backups found in {backup_dir}"
                 }
             
-            backups = []
-            
+            # Prefer the manifest: one indexed query instead of a directory
+            # scan plus a metadata read per backup
+            manifest_path = os.path.join(backup_dir, 'index.db')
+            if os.path.exists(manifest_path):
+                # Escape LIKE wildcards so the filter keeps plain substring
+                # semantics — sanitized backup names are full of '_', which
+                # LIKE would otherwise treat as match-any-character
+                escaped = (file_pattern.replace('\\', '\\\\')
+                           .replace('%', '\\%').replace('_', '\\_'))
+                conn = sqlite3.connect(manifest_path)
+                try:
+                    rows = conn.execute(
+                        'SELECT filename, backup_path, original_path, size, created, hash'
+                        " FROM backups WHERE filename LIKE ? ESCAPE '\\'"
+                        ' ORDER BY created DESC',
+                        (f'%{escaped}%',)
+                    ).fetchall()
+                finally:
+                    conn.close()
+
+                backups = [
+                    {
+                        "filename": filename,
+                        "backup_path": backup_path,
+                        "original_path": original_path,
+                        "size": size,
+                        "created": created,
+                        "metadata": {
+                            "original_path": original_path,
+                            "backup_path": backup_path,
+                            "size": size,
+                            "hash": file_hash
+                        }
+                    }
+                    for filename, backup_path, original_path, size, created, file_hash in rows
+                ]
+
+                return {
+                    "success": True,
+                    "backups": backups,
+                    "count": len(backups),
+                    "message": f"Found {len(backups)} backups in {backup_dir}"
+                }
+
+            # No manifest yet (backups predate it) — fall back to scanning
+            entries = []
+
             for filename in os.listdir(backup_dir):
-                if filename.endswith('.meta'):
+                if filename.endswith('.meta') or filename == 'objects':
                     continue
-                
+
                 if file_pattern and file_pattern not in filename:
                     continue
-                
+
                 backup_path = os.path.join(backup_dir, filename)
-                metadata_path = f'{backup_path}.meta'
-                
-                metadata = {}
-                if os.path.exists(metadata_path):
-                    try:
-                        with open(metadata_path, 'r') as f:
-                            metadata = json.load(f)
-                    except:
-                        pass
-                
-                stat = os.stat(backup_path)
-                
-                backups.append({
-                    "filename": filename,
-                    "backup_path": backup_path,
-                    "original_path": metadata.get("original_path", ""),
-                    "size": stat.st_size,
-                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    "metadata": metadata
-                })
-            
+                entries.append((filename, backup_path, f'{backup_path}.meta'))
+
+            # Overlap the many tiny stat/read calls instead of issuing them
+            # serially; ordering is restored by the sort below
+            with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+                backups = list(executor.map(_load_backup_entry, entries))
+
             backups.sort(key=lambda x: x["created"], reverse=True)
             
             return {
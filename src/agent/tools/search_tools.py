@@ -1,9 +1,73 @@
 import os
 import re
+import bisect
 import fnmatch
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List
 from ..tools.base import BaseTool
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Ceiling on file scans submitted but not yet finished; keeps the disk
+# queue full while bounding queued work on very large trees
+_MAX_INFLIGHT = min(512, (os.cpu_count() or 1) * 64)
+
+# Files at least this large are scanned through mmap so the page cache is
+# the only copy; below it the setup cost outweighs the saved copy
+_MMAP_THRESHOLD = 64 * 1024
+
+# Read size for the streaming fallback when a large file can't be mmap'd;
+# peak memory stays near this regardless of file size
+_CHUNK_SIZE = 1 << 20
+
+# One reusable read buffer per worker thread, so scanning thousands of
+# small files doesn't allocate and free a bytes object per file
+_scan_buffer = threading.local()
+
+# Files already probed as binary, keyed by (path, mtime_ns, size) so any
+# modification invalidates the verdict; re-searches in the same session
+# skip re-opening them entirely
+_binary_cache = {}
+_BINARY_CACHE_MAX = 8192
+
+# Directories that never hold searchable sources; pruning them typically
+# cuts the files walked several-fold on real repositories
+_SKIP_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv',
+    'dist', 'build', '.mypy_cache', '.pytest_cache'
+})
+
+# Hyperscan is a DFA and cannot express backreferences
+_BACKREF = re.compile(r'\\\d')
+
+# Agent loops tend to re-issue the same search patterns; keep the compiled
+# objects across execute() calls instead of re-compiling each time
+@lru_cache(maxsize=128)
+def _compile(pattern, flags: int):
+    return re.compile(pattern, flags)
+
+def _compile_hyperscan(pattern: str, case_sensitive: bool):
+    """Compile a Hyperscan database for the pattern, or None if unsupported."""
+    if hyperscan is None or _BACKREF.search(pattern):
+        return None
+    try:
+        db = hyperscan.Database()
+        # MULTILINE mirrors the re compilation: ^/$ anchor per line
+        flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_MULTILINE
+        if not case_sensitive:
+            flags |= hyperscan.HS_FLAG_CASELESS
+        db.compile(expressions=[pattern.encode()], flags=[flags])
+        return db
+    except Exception:
+        # Pattern not supported by Hyperscan; the re backend still works
+        return None
+
 class SearchCodebaseTool(BaseTool):
     @property
     def name(self) -> str:
@@ -32,21 +96,28 @@ class SearchCodebaseTool(BaseTool):
                     "type": "boolean",
                     "default": False,
                     "description": "Whether to include binary files in search"
+                },
+                "exclude_dirs": {
+                    "type": "array",
+                    "default": [],
+                    "description": "Additional directory names to skip during the walk"
                 }
             }
         }
-    
-    def execute(self, pattern: str, file_pattern: str = "*", case_sensitive: bool = False, 
-                include_binary: bool = False) -> Dict[str, Any]:
+
+    def execute(self, pattern: str, file_pattern: str = "*", case_sensitive: bool = False,
+                include_binary: bool = False, exclude_dirs: List[str] = None) -> Dict[str, Any]:
         try:
             matches = []
             total_files = 0
             searched_files = 0
             
-            # Compile regex pattern
-            flags = 0 if case_sensitive else re.IGNORECASE
+            # Compile regex pattern. Matching is one pass over the whole
+            # buffer rather than per line, so MULTILINE is needed to keep
+            # ^ and $ anchored to lines instead of the buffer ends
+            flags = re.MULTILINE if case_sensitive else re.MULTILINE | re.IGNORECASE
             try:
-                regex = re.compile(pattern, flags)
+                regex = _compile(pattern, flags)
             except re.error as e:
                 return {
                     "success": False,
@@ -54,47 +125,92 @@ class SearchCodebaseTool(BaseTool):
                     "message": f"Invalid search pattern: {str(e)}"
                 }
             
-            # Walk through directory
-            for root, dirs, files in os.walk(os.getcwd()):
-                for filename in files:
+            skip_dirs = _SKIP_DIRS.union(exclude_dirs) if exclude_dirs else _SKIP_DIRS
+
+            # Translate the glob once; fnmatch.fnmatch re-enters its pattern
+            # cache and normcases both arguments on every call
+            file_match = _compile(fnmatch.translate(os.path.normcase(file_pattern)), 0).match
+            normcase = os.path.normcase
+
+            # Stack-based scandir traversal: directory entries carry their
+            # type, so no per-file stat is needed to tell files from dirs
+            candidates = []
+            stack = [os.getcwd()]
+            while stack:
+                current_dir = stack.pop()
+                try:
+                    with os.scandir(current_dir) as it:
+                        entries = list(it)
+                except (PermissionError, FileNotFoundError):
+                    continue
+
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune vendored/derived trees before descending
+                        if entry.name not in skip_dirs:
+                            stack.append(entry.path)
+                        continue
+
                     total_files += 1
-                    
+
                     # Skip if file doesn't match pattern
-                    if not fnmatch.fnmatch(filename, file_pattern):
-                        continue
-                    
-                    filepath = os.path.join(root, filename)
-                    
-                    # Skip binary files if not included
-                    if not include_binary and self._is_binary_file(filepath):
+                    if not file_match(normcase(entry.name)):
                         continue
-                    
-                    searched_files += 1
-                    
+
                     try:
-                        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            
-                            # Search for matches
-                            line_matches = []
-                            lines = content.split('\n')
-                            
-                            for i, line in enumerate(lines):
-                                if regex.search(line):
-                                    line_matches.append({
-                                        "line_number": i + 1,
-                                        "line": line.strip(),
-                                        "match": regex.search(line).group()
-                                    })
-                            
-                            if line_matches:
-                                matches.append({
-                                    "file": filepath,
-                                    "matches": line_matches
-                                })
-                    except Exception as e:
-                        # Skip files that can't be read
+                        stat = entry.stat()
+                        cache_key = (entry.path, stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        cache_key = None
+
+                    candidates.append((entry.path, cache_key))
+
+            # Optional single-pass DFA backend; re remains the fallback
+            hs_db = _compile_hyperscan(pattern, case_sensitive)
+            hs_lock = threading.Lock()
+
+            # Bytes twin of the pattern for scanning mmap'd buffers directly
+            try:
+                regex_bytes = _compile(pattern.encode(), flags)
+            except (re.error, UnicodeError):
+                regex_bytes = None
+
+            # Patterns with no metacharacters (typically identifiers) can
+            # skip the regex engine entirely for bytes.find's C substring
+            # scan; only safe case-sensitively, where no folding is needed
+            needle = None
+            if case_sensitive and re.escape(pattern) == pattern:
+                needle = pattern.encode()
+
+            # The per-file probe + read + scan is I/O-bound, so overlap it
+            # across a thread pool; the compiled regex is thread-safe.
+            # A semaphore throttles submission to _MAX_INFLIGHT outstanding
+            # scans: completions release capacity, so the submitter slows
+            # down exactly when the disk does
+            inflight = threading.Semaphore(_MAX_INFLIGHT)
+
+            def scan(candidate):
+                filepath, cache_key = candidate
+                try:
+                    return self._scan_file(filepath, regex, include_binary,
+                                           hs_db, hs_lock, regex_bytes, needle,
+                                           cache_key)
+                finally:
+                    inflight.release()
+
+            with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+                futures = []
+                for candidate in candidates:
+                    inflight.acquire()
+                    futures.append(executor.submit(scan, candidate))
+
+                for future in futures:
+                    result = future.result()
+                    if result is None:
                         continue
+                    searched_files += 1
+                    if result["matches"]:
+                        matches.append(result)
             
             return {
                 "success": True,
@@ -115,14 +231,239 @@ class SearchCodebaseTool(BaseTool):
                 "message": f"Failed to search codebase: {str(e)}"
             }
     
-    def _is_binary_file(self, filepath: str) -> bool:
-        """Check if a file is binary"""
+    def _scan_file(self, filepath: str, regex, include_binary: bool,
+                   hs_db=None, hs_lock=None, regex_bytes=None,
+                   needle=None, cache_key=None) -> Dict[str, Any]:
+        """Scan one file for matches; returns None for skipped files"""
+        # A file already probed as binary (and unchanged since) is skipped
+        # without the open
+        if not include_binary and cache_key is not None and _binary_cache.get(cache_key):
+            return None
+
         try:
+            # One open serves both the binary probe and the full read, so a
+            # rejected binary file costs only its first 1KB
             with open(filepath, 'rb') as f:
-                chunk = f.read(1024)
-                return b'\0' in chunk
-        except:
-            return True
+                head = f.read(1024)
+                if not include_binary and b'\0' in head:
+                    if cache_key is not None:
+                        if len(_binary_cache) >= _BINARY_CACHE_MAX:
+                            _binary_cache.clear()
+                        _binary_cache[cache_key] = True
+                    return None
+
+                size = os.fstat(f.fileno()).st_size
+
+                # Large files: regex directly over the mmap'd pages, no
+                # user-space copy of the whole file
+                if regex_bytes is not None and size >= _MMAP_THRESHOLD:
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            spans = self._match_spans(mm, regex_bytes, hs_db, hs_lock, needle)
+                            return {
+                                "file": filepath,
+                                "matches": self._spans_to_line_matches(mm, spans)
+                            }
+                    except (ValueError, OSError):
+                        # mmap unavailable (odd filesystems, size races):
+                        # stream in bounded chunks instead of f.read()-ing
+                        # the whole file onto the heap
+                        return self._scan_chunked(f, filepath, regex_bytes)
+
+                # readinto this thread's buffer, grown only when a file
+                # exceeds everything seen so far
+                buf = getattr(_scan_buffer, 'buf', None)
+                if buf is None or len(buf) < size:
+                    buf = bytearray(max(size, _CHUNK_SIZE))
+                    _scan_buffer.buf = buf
+                buf[:len(head)] = head
+                end = len(head)
+                if size > end:
+                    end += f.readinto(memoryview(buf)[end:size])
+                data = buf
+        except Exception:
+            # Skip files that can't be read
+            return None
+
+        if hs_db is not None or regex_bytes is not None:
+            # Match on the raw bytes: no second buffer, no codec pass, and
+            # only matching lines ever get decoded
+            return {
+                "file": filepath,
+                "matches": self._spans_to_line_matches(
+                    data, self._match_spans(data, regex_bytes, hs_db, hs_lock, needle, end), end)
+            }
+
+        # Rare fallback for patterns with no bytes twin: decode and scan
+        # as text
+        content = bytes(memoryview(data)[:end]).decode('utf-8', 'ignore')
+
+        # Cheap gate first: files without a match skip the line
+        # bookkeeping entirely
+        if regex.search(content) is None:
+            return {"file": filepath, "matches": []}
+
+        line_starts = [0]
+        pos = content.find('\n')
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = content.find('\n', pos + 1)
+
+        # One finditer pass over the whole buffer, with line numbers
+        # recovered by bisecting the line-start index
+        line_matches = []
+        for m in regex.finditer(content):
+            line_number = bisect.bisect_right(line_starts, m.start())
+            line_start = line_starts[line_number - 1]
+            line_end = content.find('\n', line_start)
+            if line_end == -1:
+                line_end = len(content)
+
+            line_matches.append({
+                "line_number": line_number,
+                "line": content[line_start:line_end].strip(),
+                "match": m.group()
+            })
+
+        return {
+            "file": filepath,
+            "matches": line_matches
+        }
+
+    def _match_spans(self, data, regex_bytes, hs_db=None, hs_lock=None,
+                     needle=None, end=None) -> List[tuple]:
+        """Collect match byte spans, preferring the native DFA backend"""
+        if end is None:
+            end = len(data)
+
+        if needle is not None:
+            # Literal pattern: a plain substring scan beats interpreting a
+            # regex program per position
+            spans = []
+            step = len(needle)
+            pos = data.find(needle, 0, end)
+            while pos != -1:
+                spans.append((pos, pos + step))
+                pos = data.find(needle, pos + step, end)
+            return spans
+
+        if hs_db is not None:
+            # Hyperscan streams the whole buffer through a DFA in one pass;
+            # its scratch space is not thread-safe, hence the lock
+            spans = []
+
+            def on_match(match_id, start, stop, flags, ctx):
+                spans.append((start, stop))
+
+            try:
+                payload = data if end == len(data) and isinstance(data, bytes) \
+                    else bytes(memoryview(data)[:end])
+                with hs_lock:
+                    hs_db.scan(payload, match_event_handler=on_match)
+                return self._dedup_spans(spans)
+            except TypeError:
+                # Bindings that can't take this buffer type (e.g. mmap);
+                # fall through to the re engine
+                pass
+
+        if regex_bytes is None:
+            return []
+
+        return [m.span() for m in regex_bytes.finditer(data, 0, end)]
+
+    @staticmethod
+    def _dedup_spans(spans: List[tuple]) -> List[tuple]:
+        """Reduce Hyperscan match events to non-overlapping spans.
+
+        With SOM_LEFTMOST the DFA reports an event at every end offset
+        (ab+ over abbb yields (0,2), (0,3), (0,4)); keep the longest span
+        per start and drop spans beginning inside one already kept, which
+        matches the re engine's non-overlapping output.
+        """
+        if not spans:
+            return spans
+
+        longest = {}
+        for start, stop in spans:
+            if stop > longest.get(start, -1):
+                longest[start] = stop
+
+        deduped = []
+        last_stop = -1
+        for start in sorted(longest):
+            if start >= last_stop:
+                deduped.append((start, longest[start]))
+                last_stop = longest[start]
+        return deduped
+
+    def _scan_chunked(self, f, filepath: str, regex_bytes) -> Dict[str, Any]:
+        """Scan a large file in newline-aligned chunks with bounded memory"""
+        f.seek(0)
+        line_matches = []
+        lines_before = 0
+        leftover = b''
+
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            if chunk:
+                buf = leftover + chunk
+                # Only scan up to the last complete line so a match can't
+                # be split across chunk boundaries
+                last_newline = buf.rfind(b'\n')
+                if last_newline == -1:
+                    leftover = buf
+                    continue
+                region = buf[:last_newline + 1]
+                leftover = buf[last_newline + 1:]
+            else:
+                region = leftover
+                leftover = b''
+
+            if region:
+                spans = [m.span() for m in regex_bytes.finditer(region)]
+                for match in self._spans_to_line_matches(region, spans):
+                    match["line_number"] += lines_before
+                    line_matches.append(match)
+                lines_before += region.count(b'\n')
+
+            if not chunk:
+                break
+
+        return {
+            "file": filepath,
+            "matches": line_matches
+        }
+
+    def _spans_to_line_matches(self, data, spans: List[tuple],
+                               data_end=None) -> List[Dict[str, Any]]:
+        """Convert byte-offset match spans to per-line match records"""
+        if not spans:
+            return []
+
+        if data_end is None:
+            data_end = len(data)
+
+        line_starts = [0]
+        pos = data.find(b'\n', 0, data_end)
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = data.find(b'\n', pos + 1, data_end)
+
+        line_matches = []
+        for start, end in spans:
+            line_number = bisect.bisect_right(line_starts, start)
+            line_start = line_starts[line_number - 1]
+            line_end = data.find(b'\n', line_start, data_end)
+            if line_end == -1:
+                line_end = data_end
+
+            line_matches.append({
+                "line_number": line_number,
+                "line": data[line_start:line_end].decode('utf-8', 'ignore').strip(),
+                "match": data[start:end].decode('utf-8', 'ignore')
+            })
+
+        return line_matches
 
 class GetStructureTool(BaseTool):
     @property
@@ -165,8 +506,16 @@ class GetStructureTool(BaseTool):
         try:
             if exclude_patterns is None:
                 exclude_patterns = ["__pycache__", ".git", "node_modules", ".vscode"]
-            
-            structure = self._build_structure(path, max_depth, include_files, exclude_patterns)
+
+            # One compiled alternation instead of a Python substring loop
+            # per directory entry. An empty pattern list must exclude
+            # nothing — re.compile("") would match every name
+            if exclude_patterns:
+                exclude_search = re.compile("|".join(re.escape(p) for p in exclude_patterns)).search
+            else:
+                exclude_search = lambda name: None
+
+            structure = self._build_structure(path, max_depth, include_files, exclude_search)
             
             return {
                 "success": True,
@@ -182,41 +531,45 @@ class GetStructureTool(BaseTool):
                 "message": f"Failed to get structure: {str(e)}"
             }
     
-    def _build_structure(self, path: str, max_depth: int, include_files: bool, 
-                         exclude_patterns: List[str], current_depth: int = 0) -> Dict[str, Any]:
+    def _build_structure(self, path: str, max_depth: int, include_files: bool,
+                         exclude_search, current_depth: int = 0) -> Dict[str, Any]:
         """Recursively build directory structure"""
         if current_depth >= max_depth:
             return {"type": "directory", "name": os.path.basename(path), "truncated": True}
-        
+
+        # Hoist hot attribute lookups to locals
+        abspath = os.path.abspath
+
         structure = {
             "type": "directory",
             "name": os.path.basename(path),
-            "path": os.path.abspath(path),
+            "path": abspath(path),
             "children": []
         }
-        
+
         try:
-            for item in os.listdir(path):
-                # Skip excluded patterns
-                if any(pattern in item for pattern in exclude_patterns):
-                    continue
-                
-                item_path = os.path.join(path, item)
-                
-                if os.path.isdir(item_path):
-                    # Recursively add directory
-                    dir_structure = self._build_structure(
-                        item_path, max_depth, include_files, exclude_patterns, current_depth + 1
-                    )
-                    structure["children"].append(dir_structure)
-                elif include_files:
-                    # Add file
-                    structure["children"].append({
-                        "type": "file",
-                        "name": item,
-                        "path": os.path.abspath(item_path),
-                        "size": os.path.getsize(item_path)
-                    })
+            # scandir reuses the dirent the kernel already returned, so type
+            # and size checks don't cost an extra stat per entry
+            with os.scandir(path) as it:
+                for entry in it:
+                    # Skip excluded patterns
+                    if exclude_search(entry.name):
+                        continue
+
+                    if entry.is_dir(follow_symlinks=False):
+                        # Recursively add directory
+                        dir_structure = self._build_structure(
+                            entry.path, max_depth, include_files, exclude_search, current_depth + 1
+                        )
+                        structure["children"].append(dir_structure)
+                    elif include_files:
+                        # Add file
+                        structure["children"].append({
+                            "type": "file",
+                            "name": entry.name,
+                            "path": abspath(entry.path),
+                            "size": entry.stat().st_size
+                        })
         except PermissionError:
             # Skip directories we can't access
             structure["error"] = "Permission denied"
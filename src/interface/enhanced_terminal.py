@@ -1,4 +1,5 @@
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
@@ -6,122 +7,295 @@ from rich.table import Table
 from rich.syntax import Syntax
 from rich.markdown import Markdown
 from typing import Optional, List, Dict, Any, Generator
-import time
-import threading
+from functools import lru_cache
+import atexit
+import io
+import itertools
+import os
+import sys
 import difflib
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
 from .terminal import TerminalInterface
 
+try:
+    from diff_match_patch import diff_match_patch
+    _dmp = diff_match_patch()
+except ImportError:
+    _dmp = None
+
+# Unchanged lines kept around each change, mirroring unified_diff hunks
+_DIFF_CONTEXT = 3
+
+def _diff_text(old_content: str, new_content: str) -> str:
+    """Produce diff text for display.
+
+    Uses diff-match-patch's line-mode diff (C-backed where the native
+    wheel is installed) when available; difflib's pure-Python
+    SequenceMatcher is the fallback.
+    """
+    if old_content == new_content:
+        return ""
+
+    # Accumulate into one growable buffer rather than materializing a
+    # list of every diff fragment and joining it afterwards
+    buf = io.StringIO()
+
+    if _dmp is not None:
+        # Line mode hashes each line to a character first, so the match
+        # runs over lines instead of characters
+        chars_a, chars_b, line_array = _dmp.diff_linesToChars(old_content, new_content)
+        diffs = _dmp.diff_main(chars_a, chars_b, False)
+        _dmp.diff_charsToLines(diffs, line_array)
+
+        buf.write("--- Original\n+++ Modified\n")
+
+        def write_context(lines):
+            for line in lines:
+                buf.write(" ")
+                buf.write(line)
+
+        last = len(diffs) - 1
+        for idx, (op, text) in enumerate(diffs):
+            lines = text.splitlines(keepends=True)
+            if op == 0:
+                # Equal runs are context, not content: keep a few lines
+                # around each change and elide the rest, so a one-line
+                # change in a large file doesn't render the whole document
+                keep_head = _DIFF_CONTEXT if idx != 0 else 0
+                keep_tail = _DIFF_CONTEXT if idx != last else 0
+                if len(lines) > keep_head + keep_tail + 1:
+                    write_context(lines[:keep_head])
+                    buf.write("...\n")
+                    if keep_tail:
+                        write_context(lines[-keep_tail:])
+                else:
+                    write_context(lines)
+                continue
+
+            prefix = "-" if op < 0 else "+"
+            for line in lines:
+                buf.write(prefix)
+                buf.write(line)
+    else:
+        buf.writelines(difflib.unified_diff(
+            old_content.splitlines(keepends=True),
+            new_content.splitlines(keepends=True),
+            fromfile="Original",
+            tofile="Modified",
+            lineterm=""
+        ))
+
+    return buf.getvalue()
+
+@lru_cache(maxsize=32)
+def _get_lexer(language: str):
+    """Resolve a pygments lexer once per language name.
+
+    Syntax() does the registry lookup on every render otherwise; an
+    unknown name falls back to the string so Syntax handles it as before.
+    """
+    try:
+        return get_lexer_by_name(language)
+    except ClassNotFound:
+        return language
+
+# Extensions that get a highlighted diff; others print as plain text
+_DIFF_HIGHLIGHT_EXTS = frozenset({'.py', '.js', '.ts'})
+
+# Choice menus reuse the same small numerals; format them once
+_IDX_STR = tuple(str(i) for i in range(1, 257))
+
+# Static panel, assembled once; Text.assemble skips the markup tokenizer
+_WELCOME_PANEL = Panel(
+    Text.assemble(
+        ("AI Coding Agent", "bold blue"),
+        ("\n\nYour intelligent pair programming partner\n", ""),
+        ("Day 3: Enhanced Edition", "dim")
+    ),
+    title="Welcome",
+    border_style="blue",
+    padding=(1, 2)
+)
+
+class _BufferedConsoleFile(io.TextIOBase):
+    """8 KiB userspace buffer between the console and real stdout.
+
+    Rich can emit several write() calls per rendered frame; collecting
+    them here hands the underlying stream one write per flush boundary
+    (Rich flushes at frame/print boundaries) instead of one per segment.
+    """
+
+    def __init__(self, stream, size: int = 8192):
+        self._stream = stream
+        self._size = size
+        self._parts = []
+        self._length = 0
+
+    def write(self, s: str) -> int:
+        self._parts.append(s)
+        self._length += len(s)
+        if self._length >= self._size:
+            self.flush()
+        return len(s)
+
+    def flush(self):
+        if self._parts:
+            self._stream.write("".join(self._parts))
+            self._parts.clear()
+            self._length = 0
+        self._stream.flush()
+
+    def isatty(self) -> bool:
+        return self._stream.isatty()
+
+    def fileno(self) -> int:
+        return self._stream.fileno()
+
+    @property
+    def encoding(self):
+        return getattr(self._stream, "encoding", "utf-8")
+
+@lru_cache(maxsize=64)
+def _parse_markdown(content: str) -> Markdown:
+    """Parse markdown once per distinct string.
+
+    Markdown() walks the whole document on construction; repeated text
+    such as the help screen or fixed prompts only pays that cost once.
+    """
+    return Markdown(content)
+
 class EnhancedTerminalInterface(TerminalInterface):
     def __init__(self):
         super().__init__()
-        self.console = Console()
+        self.console = Console(file=_BufferedConsoleFile(sys.stdout))
         self.streaming = False
         self.current_stream = None
         self.progress_bars = {}
+        self._progress_ids = itertools.count(1)
+        self._progress = None
     
     def display_welcome(self):
-        welcome_text = Panel(
-            "[bold blue]AI Coding Agent[/bold blue]\n\n"
-            "Your intelligent pair programming partner\n"
-            "[dim]Day 3: Enhanced Edition[/dim]",
-            title="Welcome",
-            border_style="blue",
-            padding=(1, 2)
-        )
-        self.console.print(welcome_text)
-    
+        self.console.print(_WELCOME_PANEL)
+
+    def get_user_input(self, prompt: str = "> ") -> str:
+        # Drain the console's userspace buffer before blocking on input
+        self.console.file.flush()
+        return super().get_user_input(prompt)
+
     def display_streaming_response(self, response_generator, title: Optional[str] = None):
-        """Display a streaming response with progress indicator"""
+        """Display a streaming response rendered live as chunks arrive"""
+        # Piped or CI output has no live display to update; collect the
+        # stream and render once instead of paying per-chunk re-renders
+        # nobody can see
+        if not self.console.is_terminal:
+            content = "".join(response_generator)
+            if title:
+                self.console.print(Panel(
+                    Markdown(content),
+                    title=title,
+                    border_style="green",
+                    padding=(1, 2)
+                ))
+            else:
+                self.console.print(Markdown(content))
+            return
+
         self.streaming = True
         self.current_stream = ""
-        
-        def update_stream():
+
+        def render():
+            if title:
+                return Panel(
+                    Markdown(self.current_stream),
+                    title=title,
+                    border_style="green",
+                    padding=(1, 2)
+                )
+            return Markdown(self.current_stream)
+
+        # Consume the generator directly: the display updates at the
+        # stream's own cadence, with no worker thread, artificial delay,
+        # or progress poll in between. Live diffs the screen so only
+        # changed rows are rewritten. Re-parsing the whole markdown body
+        # per chunk is quadratic, so re-render only when the stream grows
+        # past another 512-byte boundary, with a final render at the end.
+        with Live(render(), console=self.console, refresh_per_second=15) as live:
+            last_bucket = -1
             for chunk in response_generator:
                 self.current_stream += chunk
-                time.sleep(0.03)  # Simulate streaming delay
-        
-        # Start streaming in a separate thread
-        stream_thread = threading.Thread(target=update_stream)
-        stream_thread.daemon = True
-        stream_thread.start()
-        
-        # Display progress while streaming
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-            transient=True,
-        ) as progress:
-            task = progress.add_task("Processing...", total=100)
-            
-            while stream_thread.is_alive():
-                progress.update(task, advance=1)
-                time.sleep(0.1)
-        
-        # Display the final response
-        if title:
-            response_panel = Panel(
-                Markdown(self.current_stream),
-                title=title,
-                border_style="green",
-                padding=(1, 2)
-            )
-            self.console.print(response_panel)
-        else:
-            self.console.print(Markdown(self.current_stream))
-        
+                bucket = len(self.current_stream) >> 9
+                if bucket != last_bucket:
+                    last_bucket = bucket
+                    live.update(render())
+            live.update(render())
+
         self.streaming = False
         self.current_stream = None
     
-    def display_table(self, data: List[Dict[str, Any]], title: Optional[str] = None, 
+    def render_group(self, *renderables):
+        """Emit several renderables in one console write"""
+        self.console.print(Group(*renderables))
+
+    def display_table(self, data: List[Dict[str, Any]], title: Optional[str] = None,
                      columns: Optional[List[str]] = None):
         """Display data in a formatted table"""
-        if not data:
+        table = self.build_table(data, title, columns)
+        if table is None:
             self.display_response("No data to display", title)
             return
-        
+        self.console.print(table)
+
+    def build_table(self, data: List[Dict[str, Any]], title: Optional[str] = None,
+                    columns: Optional[List[str]] = None):
+        """Build a table renderable; returns None when there is no data"""
+        if not data:
+            return None
+
         table = Table(title=title, show_header=True, header_style="bold magenta")
-        
-        # Use provided columns or infer from first row
-        if columns:
-            for col in columns:
-                table.add_column(col.replace("_", " ").title())
-        else:
-            for key in data[0].keys():
-                table.add_column(key.replace("_", " ").title())
-        
+
+        # Use provided columns or infer from first row, resolved once
+        # rather than per row
+        keys = columns if columns else list(data[0].keys())
+        for key in keys:
+            # The renderer truncates overlong cells itself, so rows don't
+            # need a Python-level length check and slice per value
+            table.add_column(key.replace("_", " ").title(),
+                             max_width=50, overflow="ellipsis", no_wrap=True)
+
         # Add rows
         for row in data:
-            values = []
-            for key in (columns if columns else data[0].keys()):
-                value = str(row.get(key, ""))
-                # Truncate long values
-                if len(value) > 50:
-                    value = value[:47] + "..."
-                values.append(value)
-            table.add_row(*values)
-        
-        self.console.print(table)
+            table.add_row(*(
+                value if isinstance(value, str) else str(value)
+                for value in (row.get(key, "") for key in keys)
+            ))
+
+        return table
     
+    def display_kv_table(self, pairs, title: Optional[str] = None,
+                         columns=("Key", "Value")):
+        """Display (key, value) tuples as a two-column table.
+
+        Takes any iterable of pairs, so callers can stream rows straight
+        in without building a list of per-row dicts for display_table.
+        """
+        table = Table(title=title, show_header=True, header_style="bold magenta")
+        for col in columns:
+            table.add_column(col, max_width=50, overflow="ellipsis", no_wrap=True)
+
+        for key, value in pairs:
+            table.add_row(key, value if isinstance(value, str) else str(value))
+
+        self.console.print(table)
+
     def display_diff(self, old_content: str, new_content: str, title: Optional[str] = None):
         """Display a diff between two texts with syntax highlighting"""
-        diff = difflib.unified_diff(
-            old_content.splitlines(keepends=True),
-            new_content.splitlines(keepends=True),
-            fromfile="Original",
-            tofile="Modified",
-            lineterm=""
-        )
-        
-        diff_text = "".join(diff)
-        
-        # Try to detect file type for syntax highlighting
-        if title and title.endswith('.py'):
-            syntax = Syntax(diff_text, "diff", theme="monokai", line_numbers=False)
-        elif title and (title.endswith('.js') or title.endswith('.ts')):
-            syntax = Syntax(diff_text, "diff", theme="monokai", line_numbers=False)
+        diff_text = _diff_text(old_content, new_content)
+
+        # Try to detect file type for syntax highlighting; one splitext
+        # and a set lookup instead of an endswith per extension
+        if title and os.path.splitext(title)[1] in _DIFF_HIGHLIGHT_EXTS:
+            syntax = Syntax(diff_text, _get_lexer("diff"), theme="monokai", line_numbers=False)
         else:
             syntax = diff_text
         
@@ -142,91 +316,112 @@ class EnhancedTerminalInterface(TerminalInterface):
         choice_table.add_column("No.", style="cyan", width=5)
         choice_table.add_column("Option", style="white")
         
-        for i, choice in enumerate(choices, 1):
-            choice_table.add_row(str(i), choice)
-        
+        for i, choice in enumerate(choices):
+            choice_table.add_row(_IDX_STR[i] if i < len(_IDX_STR) else str(i + 1), choice)
+
         self.console.print(choice_table)
-        
+
         while True:
-            try:
-                selection = self.console.input(f"[bold green]{prompt} [/bold green]")
-                selection = int(selection)
-                if 1 <= selection <= len(choices):
-                    return selection - 1
-                else:
-                    self.console.print(f"[red]Please enter a number between 1 and {len(choices)}[/red]")
-            except ValueError:
+            selection = self.console.input(f"[bold green]{prompt} [/bold green]").strip()
+            # isdecimal screens typos without the cost of raising and
+            # catching a ValueError from int(); unlike isdigit it rejects
+            # characters such as superscripts that int() can't parse
+            if not selection.isdecimal():
                 self.console.print("[red]Please enter a valid number[/red]")
+                continue
+            selection = int(selection)
+            if 1 <= selection <= len(choices):
+                return selection - 1
+            self.console.print(f"[red]Please enter a number between 1 and {len(choices)}[/red]")
     
-    def display_progress(self, description: str, total: int = None) -> str:
-        """Create and return a progress bar"""
-        progress_id = str(time.time())
-        
-        if total:
-            self.progress_bars[progress_id] = Progress(
+    def _get_progress(self) -> Progress:
+        """Return the shared Progress, creating it on first use.
+
+        One Progress (and its Live display) handles every concurrent
+        task, so starting a new bar is an add_task call instead of a
+        fresh renderer spin-up. BarColumn pulses for tasks without a
+        total, so the same column set serves both kinds of bar.
+        """
+        if self._progress is None:
+            self._progress = Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeRemainingColumn(),
+                console=self.console,
                 transient=True,
             )
-            task = self.progress_bars[progress_id].add_task(description, total=total)
-        else:
-            self.progress_bars[progress_id] = Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True,
-            )
-            task = self.progress_bars[progress_id].add_task(description)
-        
+            atexit.register(self._progress.stop)
+        return self._progress
+
+    def display_progress(self, description: str, total: int = None) -> int:
+        """Create and return a progress bar"""
+        # A counter can't collide the way str(time.time()) could when two
+        # bars are created within the clock's resolution
+        progress_id = next(self._progress_ids)
+
+        progress = self._get_progress()
+        # Keep the task id; updates need the TaskID, not our dictionary key
+        self.progress_bars[progress_id] = progress.add_task(description, total=total)
+        progress.start()
+
         return progress_id
-    
-    def update_progress(self, progress_id: str, advance: int = 1):
+
+    def update_progress(self, progress_id: int, advance: int = 1):
         """Update a progress bar"""
         if progress_id in self.progress_bars:
-            self.progress_bars[progress_id].update(progress_id, advance=advance)
-    
-    def finish_progress(self, progress_id: str):
+            self._progress.update(self.progress_bars[progress_id], advance=advance)
+
+    def finish_progress(self, progress_id: int):
         """Finish and remove a progress bar"""
         if progress_id in self.progress_bars:
-            self.progress_bars[progress_id].stop()
-            del self.progress_bars[progress_id]
+            self._progress.remove_task(self.progress_bars.pop(progress_id))
+            if not self.progress_bars:
+                self._progress.stop()
     
     def display_code(self, code: str, language: str = "python", title: Optional[str] = None):
         """Display code with syntax highlighting"""
-        syntax = Syntax(code, language, theme="monokai", line_numbers=True)
-        
+        self.console.print(self.build_code(code, language, title))
+
+    def build_code(self, code: str, language: str = "python", title: Optional[str] = None):
+        """Build a syntax-highlighted code renderable"""
+        syntax = Syntax(code, _get_lexer(language), theme="monokai", line_numbers=True)
+
         if title:
-            code_panel = Panel(
+            return Panel(
                 syntax,
                 title=title,
                 border_style="blue",
                 padding=(1, 2)
             )
-            self.console.print(code_panel)
-        else:
-            self.console.print(syntax)
+        return syntax
     
     def display_markdown(self, content: str, title: Optional[str] = None):
         """Display markdown content"""
         if title:
             markdown_panel = Panel(
-                Markdown(content),
+                _parse_markdown(content),
                 title=title,
                 border_style="green",
                 padding=(1, 2)
             )
             self.console.print(markdown_panel)
         else:
-            self.console.print(Markdown(content))
+            self.console.print(_parse_markdown(content))
     
     def display_error_with_suggestions(self, error: str, suggestions: List[str]):
         """Display error with recovery suggestions"""
+        # Assembled Text goes straight to the renderer without a markup
+        # tokenizer pass over the user-supplied strings
+        body = Text.assemble(
+            ("Error:", "bold red"),
+            (f" {error}\n\n", ""),
+            ("Suggestions:\n", "bold yellow")
+        )
+        body.append(Text("\n").join(Text(f"• {s}") for s in suggestions))
         error_panel = Panel(
-            f"[bold red]Error:[/bold red] {error}\n\n"
-            f"[bold yellow]Suggestions:[/bold yellow]\n" + 
-            "\n".join(f"• {s}" for s in suggestions),
+            body,
             title="Error Occurred",
             border_style="red",
             padding=(1, 2)
@@ -235,14 +430,19 @@ class EnhancedTerminalInterface(TerminalInterface):
     
     def display_success(self, message: str, details: Optional[str] = None):
         """Display success message"""
+        self.console.print(self.build_success(message, details))
+
+    def build_success(self, message: str, details: Optional[str] = None):
+        """Build a success message renderable"""
         if details:
-            success_panel = Panel(
-                f"[bold green]Success![/bold green] {message}\n\n"
-                f"[dim]{details}[/dim]",
+            return Panel(
+                Text.assemble(
+                    ("Success!", "bold green"),
+                    (f" {message}\n\n", ""),
+                    (details, "dim")
+                ),
                 title="Operation Completed",
                 border_style="green",
                 padding=(1, 2)
             )
-            self.console.print(success_panel)
-        else:
-            self.console.print(f"[bold green]✓[/bold green] {message}")
\ No newline at end of file
+        return Text.assemble(("✓", "bold green"), (f" {message}", ""))
\ No newline at end of file
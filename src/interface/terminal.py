@@ -14,9 +14,31 @@ from typing import Optional, List, Dict, Any
 import time
 import threading
 
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import FileHistory
+    from prompt_toolkit.completion import WordCompleter
+except ImportError:
+    PromptSession = None
+
+_COMMAND_WORDS = [
+    'help', 'status', 'exit', 'quit',
+    'show preferences', 'show learning', 'set preference'
+]
+
 class TerminalInterface:
     def __init__(self):
         self.console = Console()
+        # prompt_toolkit batches its rendering and keeps history on disk,
+        # so recall is instant across sessions; plain input() remains the
+        # fallback when it isn't installed
+        if PromptSession is not None:
+            self._session = PromptSession(
+                history=FileHistory(os.path.expanduser('~/.ai_agent_history')),
+                completer=WordCompleter(_COMMAND_WORDS)
+            )
+        else:
+            self._session = None
     
     def display_welcome(self):
         welcome_text = Panel(
@@ -27,6 +49,12 @@ class TerminalInterface:
         self.console.print(welcome_text)
     
     def get_user_input(self, prompt: str = "> ") -> str:
+        # Prompt boundaries are the flush points when stdout is
+        # block-buffered; everything rendered so far must be visible
+        # before we wait on the user
+        sys.stdout.flush()
+        if self._session is not None:
+            return self._session.prompt(prompt)
         return input(prompt)
     
     def display_response(self, response: str, title: Optional[str] = None):
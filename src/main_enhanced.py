@@ -5,16 +5,95 @@ Enhanced main entry point for the AI Coding Agent
 
 import sys
 import os
+import re
+import logging
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from rich.markdown import Markdown
+from rich.panel import Panel
+
 from src.agent.core import Agent
 from interface.enhanced_terminal import EnhancedTerminalInterface
 
+logger = logging.getLogger(__name__)
+
+# Static screens: parse the markdown and build the panel once at import
+# instead of on every `help` command / startup
+_HELP_PANEL = Panel(
+    Markdown("""
+## Available Commands
+
+### General
+- `help` - Show this help message
+- `status` - Show current system status
+- `exit` or `quit` - Exit the agent
+
+### Preferences
+- `set preference <name> <value>` - Set a user preference
+- `show preferences` - Show current preferences
+- `show learning` - Show learning summary
+
+### Example Tasks
+#### File Operations
+- `What's in package.json?`
+- `Create a new file called hello.py`
+- `Find all TODO comments`
+
+#### Git Operations
+- `What's the git status?`
+- `Create a commit with message "Fix bug"`
+- `Show changes since last commit`
+
+#### Code Analysis
+- `Run linter on src directory`
+- `Analyze dependencies`
+- `Find references to main function`
+
+#### Testing
+- `Run all tests`
+- `Generate tests for utils module`
+
+#### Multi-step Tasks
+- `Create backup of package.json and add new dependency`
+- `Run tests and fix any failures
+
+### Tips
+- Be specific in your requests
+- Use multi-step commands for complex tasks
+- The agent learns from your feedback
+- All destructive operations show previews first
+"""),
+    title="Help",
+    border_style="green",
+    padding=(1, 2)
+)
+
+_READY_PANEL = Panel(
+    Markdown(
+        "I'm ready to help you with your coding tasks. "
+        "Type `help` for available commands or `exit` to quit."
+    ),
+    title="Ready",
+    border_style="green",
+    padding=(1, 2)
+)
+
 def main():
     """Main entry point for the enhanced AI Coding Agent"""
+    # Quiet by default; set AGENT_LOGLEVEL=DEBUG to see per-input tracing
+    logging.basicConfig(level=os.environ.get("AGENT_LOGLEVEL", "WARNING").upper())
+
+    # Block-buffer stdout so multi-line renders (panel borders and the
+    # like) coalesce into fewer write syscalls; get_user_input flushes
+    # before each prompt so interactivity is unaffected
+    try:
+        sys.stdout.reconfigure(line_buffering=False)
+    except (AttributeError, ValueError):
+        pass
+
     # Create enhanced terminal interface
     interface = EnhancedTerminalInterface()
     
@@ -37,50 +116,47 @@ def main():
             pass
         
         # Main loop
-        interface.display_markdown(
-            "I'm ready to help you with your coding tasks. "
-            "Type `help` for available commands or `exit` to quit.",
-            title="Ready"
-        )
+        interface.console.print(_READY_PANEL)
         
+        # Dispatch special commands through one table lookup instead of
+        # lowercasing the input once per elif arm
+        commands = {
+            'help': lambda: show_help(interface),
+            'status': lambda: show_status(agent, interface),
+            'show preferences': lambda: show_preferences(agent, interface),
+            'show learning': lambda: show_learning_summary(agent, interface),
+        }
+
         while True:
             try:
                 user_input = interface.get_user_input("\n> ")
-                
+                command = user_input.lower()
+
                 # Handle special commands
-                if user_input.lower() in ['exit', 'quit']:
+                if command in ('exit', 'quit'):
                     interface.display_response("Goodbye!", title="Session Ended")
                     break
-                
-                elif user_input.lower() == 'help':
-                    show_help(interface)
-                    continue
-                
-                elif user_input.lower() == 'status':
-                    show_status(agent, interface)
+
+                handler = commands.get(command)
+                if handler:
+                    handler()
                     continue
-                
-                elif user_input.lower().startswith('set preference'):
+
+                if command.startswith('set preference'):
                     handle_preference_command(agent, interface, user_input)
                     continue
+
+                # Process normal input; %r defers formatting until a
+                # handler at DEBUG level is actually attached
+                logger.debug("Processing user input: %r", user_input)
                 
-                elif user_input.lower() == 'show preferences':
-                    show_preferences(agent, interface)
-                    continue
-                
-                elif user_input.lower() == 'show learning':
-                    show_learning_summary(agent, interface)
-                    continue
-                
-                # Process normal input
-                print(f"DEBUG: Processing user input: '{user_input}'")
-                
-                # Check for multi-step task
-                if is_multi_step_task(user_input):
-                    handle_multi_step_task(agent, interface, user_input)
+                # Classify and split in one pass over the text
+                is_multi, steps = classify_task(user_input)
+                if is_multi:
+                    handle_multi_step_task(agent, interface, steps)
                 else:
                     # Single-step interaction
-                    handle_single_step_task(agent, interface, user_input)
+                    handle_single_step_task(agent, interface, steps[0])
                 
             except KeyboardInterrupt:
                 interface.display_response("\nGoodbye!", title="Interrupted")
@@ -114,71 +190,28 @@ def main():
 def show_help(interface):
     """Show help information"""
     try:
-        help_content = """
-## Available Commands
-
-### General
-- `help` - Show this help message
-- `status` - Show current system status
-- `exit` or `quit` - Exit the agent
-
-### Preferences
-- `set preference <name> <value>` - Set a user preference
-- `show preferences` - Show current preferences
-- `show learning` - Show learning summary
-
-### Example Tasks
-#### File Operations
-- `What's in package.json?`
-- `Create a new file called hello.py`
-- `Find all TODO comments`
-
-#### Git Operations
-- `What's the git status?`
-- `Create a commit with message "Fix bug"`
-- `Show changes since last commit`
-
-#### Code Analysis
-- `Run linter on src directory`
-- `Analyze dependencies`
-- `Find references to main function`
-
-#### Testing
-- `Run all tests`
-- `Generate tests for utils module`
-
-#### Multi-step Tasks
-- `Create backup of package.json and add new dependency`
-- `Run tests and fix any failures
-
-### Tips
-- Be specific in your requests
-- Use multi-step commands for complex tasks
-- The agent learns from your feedback
-- All destructive operations show previews first
-"""
-        interface.display_markdown(help_content, title="Help")
+        interface.console.print(_HELP_PANEL)
     except Exception as e:
         interface.display_error(f"Could not display help: {str(e)}")
 
 def show_status(agent, interface):
     """Show current system status"""
     try:
-        status_info = {
-            "LLM Provider": agent.llm.provider,
-            "Model": agent.llm.model,
-            "Current Directory": os.getcwd(),
-            "Session ID": agent.working_memory.current_session_id,
-            "Tools Registered": len(agent.tool_registry.list_tools()),
-            "Memory Status": "Working" if agent.working_memory.current_session_id else "Inactive",
-        }
-        
-        # Format as table
-        table_data = []
-        for key, value in status_info.items():
-            table_data.append({"Aspect": key, "Status": str(value)})
-        
-        interface.display_table(table_data, title="System Status")
+        # Feed rows straight to the table; no intermediate dict or
+        # per-row dict list to build and re-walk
+        session_id = agent.working_memory.current_session_id
+        interface.display_kv_table(
+            [
+                ("LLM Provider", agent.llm.provider),
+                ("Model", agent.llm.model),
+                ("Current Directory", os.getcwd()),
+                ("Session ID", session_id),
+                ("Tools Registered", len(agent.tool_registry.list_tools())),
+                ("Memory Status", "Working" if session_id else "Inactive"),
+            ],
+            title="System Status",
+            columns=("Aspect", "Status")
+        )
     except Exception as e:
         interface.display_error(f"Could not get status: {str(e)}")
 
@@ -258,25 +291,34 @@ def show_learning_summary(agent, interface):
     except Exception as e:
         interface.display_error(f"Could not get learning summary: {str(e)}")
 
-def is_multi_step_task(user_input):
-    """Check if the task is multi-step"""
-    multi_step_keywords = [
-        " and then ", " after that ", " followed by ", " then ", " next ",
-        " first ", " second ", " third ", " finally "
-    ]
-    return any(keyword in user_input.lower() for keyword in multi_step_keywords)
+# One compiled pattern shared by detection and splitting; longer
+# delimiters come first so " and then " wins over " then "
+_STEP_RE = re.compile(
+    r" and then | after that | followed by | then | next "
+    r"| first | second | third | finally ",
+    re.IGNORECASE
+)
+
+def classify_task(text):
+    """Return (is_multi_step, steps) from a single scan of the text"""
+    parts = [part.strip() for part in _STEP_RE.split(text) if part.strip()]
+    if len(parts) > 1:
+        return True, parts
+    return False, [text]
 
-def handle_multi_step_task(agent, interface, user_input):
+def handle_multi_step_task(agent, interface, steps):
     """Handle multi-step tasks"""
     try:
-        steps = split_task_into_steps(user_input)
-        
         interface.display_response(
             f"I'll break this down into {len(steps)} steps:",
             title="Multi-step Task"
         )
-        
-        for i, step in enumerate(steps, 1):
+
+        # One environment snapshot serves every step; the loop below only
+        # reasons, acts and learns
+        states = agent.perceive_batch(steps)
+
+        for i, (step, state) in enumerate(zip(steps, states), 1):
             interface.display_response(
                 f"Step {i}: {step}",
                 title=f"Step {i}"
@@ -286,26 +328,32 @@ def handle_multi_step_task(agent, interface, user_input):
             progress_id = interface.display_progress(f"Executing step {i}")
             
             # Execute step
-            result = execute_step(agent, interface, step)
+            result = execute_step(agent, interface, step, state)
             
             interface.finish_progress(progress_id)
             
             if result.get("success", False):
-                interface.display_success(
+                # Group the step's output into a single console write so the
+                # terminal repaints once per step rather than per renderable
+                renderables = [interface.build_success(
                     f"Step {i} completed successfully",
                     result.get("message", "")
-                )
-                
+                )]
+
                 # Display additional content if available
                 if "content" in result:
-                    interface.display_code(result["content"], title="Result")
+                    renderables.append(interface.build_code(result["content"], title="Result"))
                 elif "items" in result:
-                    interface.display_table(
+                    table = interface.build_table(
                         [{"Item": item} for item in result["items"]],
                         title="Results"
                     )
+                    if table is not None:
+                        renderables.append(table)
                 elif "stdout" in result:
-                    interface.display_code(result["stdout"], "text", title="Output")
+                    renderables.append(interface.build_code(result["stdout"], "text", title="Output"))
+
+                interface.render_group(*renderables)
             else:
                 interface.display_error_with_suggestions(
                     f"Step {i} failed: {result.get('message', 'Unknown error')}",
@@ -320,34 +368,13 @@ def handle_multi_step_task(agent, interface, user_input):
     except Exception as e:
         interface.display_error(f"Error in multi-step task: {str(e)}")
 
-def split_task_into_steps(task):
-    """Split a multi-step task into individual steps"""
-    steps = []
-    current_step = ""
-    
-    # Split on common delimiters
-    delimiters = [
-        " and then ", " after that ", " followed by ", " then ", " next ",
-        " first ", " second ", " third ", " finally "
-    ]
-    
-    for delimiter in delimiters:
-        if delimiter in task.lower():
-            parts = task.lower().split(delimiter)
-            steps = [part.strip() for part in parts if part.strip()]
-            break
-    
-    if not steps:
-        steps = [task]
-    
-    return steps
-
-def execute_step(agent, interface, step):
-    """Execute a single step"""
+def execute_step(agent, interface, step, state=None):
+    """Execute a single step, perceiving unless a state is supplied"""
     try:
-        # Perceive
-        state = agent.perceive(step)
-        
+        # Perceive (skipped when the caller batched it)
+        if state is None:
+            state = agent.perceive(step)
+
         # Reason
         action = agent.reason(state)
         
@@ -389,16 +416,19 @@ def handle_single_step_task(agent, interface, user_input):
             
             # Display additional content based on result type
             if "content" in result:
-                # Clean up BOM if present
+                # Clean up BOM if present; almost no content starts
+                # with one, so a single first-character test gates the
+                # startswith/re-decode work
                 content = result["content"]
-                if content.startswith('\ufeff'):
-                    content = content[1:]
-                elif content.startswith('ÿþ'):
-                    # UTF-16 BOM - try to decode properly
-                    try:
-                        content = content.encode('latin-1').decode('utf-16')
-                    except:
-                        pass
+                if content and content[0] in '\ufeffÿ':
+                    if content[0] == '\ufeff':
+                        content = content[1:]
+                    elif content.startswith('ÿþ'):
+                        # UTF-16 BOM - try to decode properly
+                        try:
+                            content = content.encode('latin-1').decode('utf-16')
+                        except:
+                            pass
                 
                 interface.display_code(content, title="Content")
             elif "items" in result: